@@ -7,7 +7,7 @@ from typing import List
 from io import StringIO
 
 from pdf_slack_bot.utils import configs
-from pdf_slack_bot.components import load_llm, ActionSelector, DocumentGetter, DocumentRAG, SlackMessageSender
+from pdf_slack_bot.components import load_llm, answer_questions_from_pdf, ActionSelector, SlackMessageSender
 
 nest_asyncio.apply()
 
@@ -40,17 +40,6 @@ def setup_logger():
 logger = setup_logger()
 
 
-async def process_pdf_and_answer_questions(pdf_filename: str, questions: List[str]) -> List[dict]:
-    document_getter = DocumentGetter()
-    document_rag = DocumentRAG()
-
-    pdf_filepath = os.path.join(configs.pdf_dir, pdf_filename)
-    documents = document_getter.get_documents_from_pdf(filepath=pdf_filepath)
-    answers = await document_rag.get_answers_from_documents(questions, documents)
-
-    return [{"question": q, "answer": a} for q, a in zip(questions, answers)]
-
-
 async def main(pdf_file, questions: List[str], agent_query: str):
     llm = load_llm(os.getenv("OPENAI_MODEL", configs.DEFAULT_LLM))
     action_selector = ActionSelector(llm_model=llm)
@@ -64,7 +53,7 @@ async def main(pdf_file, questions: List[str], agent_query: str):
 
         post_to_slack, reason = action_selector.select_action(questions, agent_query)
         logger.info(reason)
-        response_obj = await process_pdf_and_answer_questions(pdf_filename, questions)
+        response_obj = await answer_questions_from_pdf(pdf_filename, questions)
 
         logger.info("Successfully processed user queries!")
         if post_to_slack:
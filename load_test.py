@@ -0,0 +1,416 @@
+import json
+import time
+import random
+import asyncio
+import hashlib
+import logging
+import argparse
+from typing import Any, List, Sequence
+
+import requests
+from llama_index.core import Settings
+from llama_index.core.embeddings import BaseEmbedding
+from llama_index.core.llms import CustomLLM, CompletionResponse, CompletionResponseGen, LLMMetadata
+from llama_index.core.llms.callbacks import llm_completion_callback
+
+from main import process_pdf_and_answer_questions
+from pdf_slack_bot.utils import configs
+from pdf_slack_bot.components import DocumentRAG, IndexWarmer, ModelRouter, SlackMessageSender
+from pdf_slack_bot.components.rag import ANSWER_ERROR_PREFIX
+
+DEFAULT_QUESTION_MIX = [
+    ("What is the name of the company?", 5),
+    ("Who is the CEO of the company?", 4),
+    ("What is their vacation policy?", 3),
+    ("What is the termination policy?", 2),
+    ("Is google a competitor to the company?", 1),
+]
+
+
+def _sample_latency(median_ms: float, sigma: float) -> float:
+    """Sample a latency in seconds from a log-normal distribution with the given median."""
+    return random.lognormvariate(0, sigma) * median_ms / 1000 if median_ms > 0 else 0.0
+
+
+def _maybe_fail(error_rate: float, backend: str):
+    """Raise a simulated backend error with the given probability."""
+    if random.random() < error_rate:
+        raise RuntimeError(f"Simulated {backend} error")
+
+
+class FakeLLM(CustomLLM):
+    """An LLM that returns canned answers, or fails, after a simulated, log-normally distributed latency."""
+    model: str = 'gpt-4o-mini'
+    latency_ms: float = 800.0
+    latency_sigma: float = 0.5
+    not_available_rate: float = 0.0
+    error_rate: float = 0.0
+
+    @property
+    def metadata(self) -> LLMMetadata:
+        return LLMMetadata(model_name=self.model, is_chat_model=False)
+
+    def _answer(self) -> str:
+        if random.random() < self.not_available_rate:
+            return "Data Not Available"
+        return f"Simulated answer from {self.model}."
+
+    @llm_completion_callback()
+    def complete(self, prompt: str, formatted: bool = False, **kwargs: Any) -> CompletionResponse:
+        time.sleep(_sample_latency(self.latency_ms, self.latency_sigma))
+        _maybe_fail(self.error_rate, 'LLM')
+        return CompletionResponse(text=self._answer())
+
+    @llm_completion_callback()
+    async def acomplete(self, prompt: str, formatted: bool = False, **kwargs: Any) -> CompletionResponse:
+        await asyncio.sleep(_sample_latency(self.latency_ms, self.latency_sigma))
+        _maybe_fail(self.error_rate, 'LLM')
+        return CompletionResponse(text=self._answer())
+
+    @llm_completion_callback()
+    def stream_complete(self, prompt: str, formatted: bool = False, **kwargs: Any) -> CompletionResponseGen:
+        yield self.complete(prompt, formatted=formatted, **kwargs)
+
+
+class FakeEmbedding(BaseEmbedding):
+    """
+    An embedding model returning deterministic non-negative vectors, or failing, after a simulated latency.
+
+    Non-negative random vectors have a mean cosine similarity of about 0.75, close to what real embeddings
+    give for loosely related text, so model routing sees a realistic spread of retrieval scores.
+    """
+    dimensions: int = 64
+    latency_ms: float = 50.0
+    latency_sigma: float = 0.3
+    error_rate: float = 0.0
+
+    def _embed(self, text: str) -> List[float]:
+        rng = random.Random(hashlib.md5(text.encode()).hexdigest())
+        return [rng.random() for _ in range(self.dimensions)]
+
+    def _get_query_embedding(self, query: str) -> List[float]:
+        time.sleep(_sample_latency(self.latency_ms, self.latency_sigma))
+        _maybe_fail(self.error_rate, 'embedding')
+        return self._embed(query)
+
+    async def _aget_query_embedding(self, query: str) -> List[float]:
+        await asyncio.sleep(_sample_latency(self.latency_ms, self.latency_sigma))
+        _maybe_fail(self.error_rate, 'embedding')
+        return self._embed(query)
+
+    def _get_text_embedding(self, text: str) -> List[float]:
+        return self._get_query_embedding(text)
+
+    def _get_text_embeddings(self, texts: List[str]) -> List[List[float]]:
+        time.sleep(_sample_latency(self.latency_ms, self.latency_sigma))
+        _maybe_fail(self.error_rate, 'embedding')
+        return [self._embed(text) for text in texts]
+
+    async def _aget_text_embeddings(self, texts: List[str]) -> List[List[float]]:
+        await asyncio.sleep(_sample_latency(self.latency_ms, self.latency_sigma))
+        _maybe_fail(self.error_rate, 'embedding')
+        return [self._embed(text) for text in texts]
+
+
+class _FakeSlackResponse:
+    @staticmethod
+    def json() -> dict:
+        return {'ok': True}
+
+
+class FakeSlackMessageSender(SlackMessageSender):
+    """A SlackMessageSender that simulates the Slack API instead of calling it."""
+
+    def __init__(self, latency_ms: float = 150.0, latency_sigma: float = 0.4, error_rate: float = 0.0):
+        super().__init__()
+        self._bot_token = 'fake-token'
+        self._channel_id = 'C_LOAD_TEST'
+        self._latency_ms = latency_ms
+        self._latency_sigma = latency_sigma
+        self._error_rate = error_rate
+
+    def _send_request(self, slack_data: dict) -> _FakeSlackResponse:
+        time.sleep(_sample_latency(self._latency_ms, self._latency_sigma))
+        if random.random() < self._error_rate:
+            raise requests.RequestException("Simulated Slack API error")
+        return _FakeSlackResponse()
+
+
+def _percentile(sorted_values: Sequence[float], percentile: float) -> float:
+    """Linearly interpolated percentile of already sorted values."""
+    if not sorted_values:
+        return float('nan')
+    position = (len(sorted_values) - 1) * percentile / 100
+    lower = int(position)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * (position - lower)
+
+
+class LoadTest:
+    """
+    An open-loop load generator for the PDF question answering and Slack sending path.
+
+    Requests arrive as a Poisson process at each configured rate regardless of how many are still running,
+    so queueing delay shows up in the latencies instead of silently lowering the offered load.
+    """
+
+    def __init__(
+            self,
+            pdf_filename: str,
+            document_rag: DocumentRAG,
+            slack_sender: SlackMessageSender,
+            question_mix: List[tuple],
+            questions_per_request: int = 3,
+            index_warmer: IndexWarmer = None,
+            request_timeout: float = 60.0,
+    ):
+        if questions_per_request < 1:
+            raise ValueError("Questions per request must be at least 1.")
+        if any(weight < 0 for _, weight in question_mix):
+            raise ValueError("Question weights must not be negative.")
+        if not any(weight > 0 for _, weight in question_mix):
+            raise ValueError("The question mix must have at least one question with a positive weight.")
+
+        self._pdf_filename = pdf_filename
+        self._document_rag = document_rag
+        self._slack_sender = slack_sender
+        self._questions = [question for question, _ in question_mix]
+        self._weights = [weight for _, weight in question_mix]
+        self._questions_per_request = min(questions_per_request, sum(1 for weight in self._weights if weight > 0))
+        self._index_warmer = index_warmer
+        self._request_timeout = request_timeout
+
+    def _sample_questions(self) -> List[str]:
+        questions = []
+        while len(questions) < self._questions_per_request:
+            question = random.choices(self._questions, weights=self._weights)[0]
+            if question not in questions:
+                questions.append(question)
+        return questions
+
+    async def _request(self):
+        """
+        Answer a sample of questions and send the answers to Slack, as the bot does for one request.
+
+        Raises:
+            RuntimeError: If any question could not be answered or the Slack message was not sent.
+        """
+        response_obj = await process_pdf_and_answer_questions(
+            self._pdf_filename,
+            self._sample_questions(),
+            index_warmer=self._index_warmer,
+            document_rag=self._document_rag,
+        )
+        sent = await asyncio.to_thread(self._slack_sender.send_message, message=json.dumps(response_obj))
+        # Failures answering a single question are returned as answers rather than raised
+        failed = [item["answer"] for item in response_obj if str(item["answer"]).startswith(ANSWER_ERROR_PREFIX)]
+        if failed:
+            raise RuntimeError(failed[0])
+        if not sent:
+            raise RuntimeError("Slack message not sent")
+
+    async def _timed_request(self, scheduled: float, latencies: List[float], lags: List[float], errors: List[str]):
+        """
+        Run one request and record its latency, measured from when it was scheduled to arrive.
+
+        Blocking work on the event loop delays when requests actually start; measuring from the scheduled
+        arrival keeps that queueing delay in the latency, and the delay itself is recorded as schedule lag.
+        """
+        lag = time.perf_counter() - scheduled
+        lags.append(lag)
+        remaining = self._request_timeout - lag
+        if remaining <= 0:
+            errors.append("timeout")
+            return
+        try:
+            await asyncio.wait_for(self._request(), timeout=remaining)
+            latencies.append(time.perf_counter() - scheduled)
+        except asyncio.TimeoutError:
+            errors.append("timeout")
+        except Exception as e:
+            errors.append(str(e))
+
+    async def run_rate(self, rate: float, duration: float) -> dict:
+        """
+        Offer load at a fixed arrival rate and measure how the bot copes.
+
+        Args:
+            rate (float): Mean arrivals per second.
+            duration (float): Seconds to keep generating arrivals.
+
+        Returns:
+            dict: Request counts, error rate, throughput, latency percentiles and how far requests started
+                behind schedule for the rate.
+
+        Raises:
+            ValueError: If the rate is not positive.
+        """
+        if rate <= 0:
+            raise ValueError(f"Arrival rate must be positive, got {rate}.")
+
+        latencies: List[float] = []
+        lags: List[float] = []
+        errors: List[str] = []
+        tasks = []
+        start = time.perf_counter()
+        next_arrival = start
+        while next_arrival - start < duration:
+            delay = next_arrival - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            tasks.append(asyncio.create_task(self._timed_request(next_arrival, latencies, lags, errors)))
+            next_arrival += random.expovariate(rate)
+        await asyncio.gather(*tasks)
+        elapsed = time.perf_counter() - start
+
+        latencies.sort()
+        lags.sort()
+        return {
+            'rate': rate,
+            'requests': len(tasks),
+            'completed': len(latencies),
+            'errors': len(errors),
+            'error_rate': len(errors) / len(tasks) if tasks else 0.0,
+            'throughput': len(latencies) / elapsed if elapsed else 0.0,
+            'p50': _percentile(latencies, 50),
+            'p95': _percentile(latencies, 95),
+            'p99': _percentile(latencies, 99),
+            'lag_p95': _percentile(lags, 95),
+            'lag_max': lags[-1] if lags else float('nan'),
+        }
+
+    async def run(self, rates: List[float], duration: float) -> List[dict]:
+        """
+        Measure a saturation curve by running each arrival rate in turn.
+
+        Args:
+            rates (List[float]): Mean arrivals per second to test, in order.
+            duration (float): Seconds to generate arrivals at each rate.
+
+        Returns:
+            List[dict]: One result per rate, as returned by run_rate.
+        """
+        results = []
+        for rate in rates:
+            result = await self.run_rate(rate, duration)
+            results.append(result)
+            print(
+                f"{result['rate']:>8.2f} {result['requests']:>8d} {result['throughput']:>10.2f} "
+                f"{result['error_rate']:>8.1%} {result['p50']:>8.2f} {result['p95']:>8.2f} {result['p99']:>8.2f} "
+                f"{result['lag_p95']:>9.2f} {result['lag_max']:>9.2f}"
+            )
+        return results
+
+
+def _rates(value: str) -> List[float]:
+    try:
+        rates = [float(rate) for rate in value.split(",")]
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid rates: {value!r}")
+    if any(rate <= 0 for rate in rates):
+        raise argparse.ArgumentTypeError(f"rates must be positive: {value!r}")
+    return rates
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Load test the PDF Slack bot against simulated backends.")
+    parser.add_argument("--pdf", default="handbook.pdf", help="PDF in the pdf directory to ask about")
+    parser.add_argument("--rates", type=_rates, default="0.5,1,2,4,8",
+                        help="Comma separated arrival rates (requests/second)")
+    parser.add_argument("--duration", type=float, default=30.0, help="Seconds of arrivals per rate")
+    parser.add_argument("--questions-per-request", type=int, default=3)
+    parser.add_argument("--questions-file", help="JSON list of [question, weight] pairs to sample from")
+    parser.add_argument("--request-timeout", type=float, default=60.0)
+    parser.add_argument("--warm", action="store_true",
+                        help="Serve indexes through an IndexWarmer that prefetches and watches in the background")
+    parser.add_argument("--warmup", type=float, default=0.0,
+                        help="Extra seconds to let the IndexWarmer run before measuring (with --warm)")
+    parser.add_argument("--llm-latency-ms", type=float, default=800.0)
+    parser.add_argument("--llm-error-rate", type=float, default=0.0, help="Fraction of LLM calls that fail")
+    parser.add_argument("--escalation-llm-latency-ms", type=float, default=2000.0)
+    parser.add_argument("--not-available-rate", type=float, default=0.1,
+                        help="Fraction of cheap model answers that are 'Data Not Available'")
+    parser.add_argument("--embed-latency-ms", type=float, default=50.0)
+    parser.add_argument("--embed-error-rate", type=float, default=0.0, help="Fraction of embedding calls that fail")
+    parser.add_argument("--slack-latency-ms", type=float, default=150.0)
+    parser.add_argument("--slack-error-rate", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", help="Write the saturation curve to this JSON file")
+    args = parser.parse_args()
+
+    if args.duration <= 0:
+        parser.error("--duration must be positive")
+    if args.questions_per_request < 1:
+        parser.error("--questions-per-request must be at least 1")
+    for name in ("not_available_rate", "llm_error_rate", "embed_error_rate", "slack_error_rate"):
+        if not 0 <= getattr(args, name) <= 1:
+            parser.error(f"--{name.replace('_', '-')} must be between 0 and 1")
+    return args
+
+
+async def main(args: argparse.Namespace):
+    random.seed(args.seed)
+    configs.logger.setLevel(logging.WARNING)
+
+    Settings.embed_model = FakeEmbedding(latency_ms=args.embed_latency_ms, error_rate=args.embed_error_rate)
+    router = ModelRouter(
+        llm_model=FakeLLM(
+            model='gpt-4o-mini',
+            latency_ms=args.llm_latency_ms,
+            not_available_rate=args.not_available_rate,
+            error_rate=args.llm_error_rate,
+        ),
+        escalation_llm_model=FakeLLM(
+            model='gpt-4o', latency_ms=args.escalation_llm_latency_ms, error_rate=args.llm_error_rate
+        ),
+    )
+    document_rag = DocumentRAG(router=router)
+    index_warmer = IndexWarmer(document_rag=document_rag) if args.warm else None
+
+    question_mix = DEFAULT_QUESTION_MIX
+    if args.questions_file:
+        with open(args.questions_file) as f:
+            question_mix = [tuple(item) for item in json.load(f)]
+
+    try:
+        load_test = LoadTest(
+            pdf_filename=args.pdf,
+            document_rag=document_rag,
+            slack_sender=FakeSlackMessageSender(latency_ms=args.slack_latency_ms, error_rate=args.slack_error_rate),
+            question_mix=question_mix,
+            questions_per_request=args.questions_per_request,
+            index_warmer=index_warmer,
+            request_timeout=args.request_timeout,
+        )
+    except ValueError as e:
+        raise SystemExit(f"Invalid load test configuration: {str(e)}")
+
+    print(
+        f"{'rate/s':>8} {'requests':>8} {'done/s':>10} {'errors':>8} {'p50 s':>8} {'p95 s':>8} {'p99 s':>8} "
+        f"{'lag p95 s':>9} {'lag max s':>9}"
+    )
+    if index_warmer:
+        # Prefetch the hot set before measuring, then keep watching while the load runs
+        await index_warmer.refresh()
+        index_warmer.start()
+        await asyncio.sleep(args.warmup)
+    try:
+        results = await load_test.run(args.rates, args.duration)
+    finally:
+        if index_warmer:
+            await index_warmer.stop()
+
+    report = {
+        'config': vars(args),
+        'routing': router.get_stats(),
+        'warmer': index_warmer.stats if index_warmer else None,
+        'results': results,
+    }
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"Saturation curve written to {args.output}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main(parse_args()))
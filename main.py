@@ -5,30 +5,34 @@ from typing import List
 
 import nest_asyncio
 from pdf_slack_bot.utils import configs
-from pdf_slack_bot.components import load_llm, ActionSelector, DocumentGetter, DocumentRAG, SlackMessageSender
+from pdf_slack_bot.components import (
+    load_llm, answer_questions_from_pdf, ActionSelector, DocumentRAG, IndexWarmer, SlackMessageSender
+)
 
 nest_asyncio.apply()
 
 
-async def process_pdf_and_answer_questions(pdf_filename: str, questions: List[str]) -> List[dict]:
+async def process_pdf_and_answer_questions(
+        pdf_filename: str,
+        questions: List[str],
+        index_warmer: IndexWarmer = None,
+        document_rag: DocumentRAG = None,
+) -> List[dict]:
     """
     Process a PDF file and answer a list of questions based on its content.
 
     Args:
         pdf_filename (str): The name of the PDF file to process.
         questions (List[str]): A list of questions to answer.
+        index_warmer (IndexWarmer, optional): Provides warm indexes for frequently used PDFs.
+        document_rag (DocumentRAG, optional): The DocumentRAG to answer with. Defaults to the shared one.
 
     Returns:
         List[dict]: A list of dictionaries containing questions and their answers.
     """
-    document_getter = DocumentGetter()
-    document_rag = DocumentRAG()
-
-    pdf_filepath = os.path.join(configs.pdf_dir, pdf_filename)
-    documents = document_getter.get_documents_from_pdf(filepath=pdf_filepath)
-    answers = await document_rag.get_answers_from_documents(questions, documents)
-
-    return [{"question": q, "answer": a} for q, a in zip(questions, answers)]
+    return await answer_questions_from_pdf(
+        pdf_filename, questions, index_warmer=index_warmer, document_rag=document_rag
+    )
 
 
 async def main(pdf_filename: str, questions: List[str], agent_query: str):
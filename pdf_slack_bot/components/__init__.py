@@ -1,13 +1,21 @@
 from pdf_slack_bot.components.action import ActionSelector
 from pdf_slack_bot.components.document import DocumentGetter
 from pdf_slack_bot.components.rag import DocumentRAG
+from pdf_slack_bot.components.router import ModelRouter
 from pdf_slack_bot.components.slack import SlackMessageSender
+from pdf_slack_bot.components.warmup import IndexWarmer
+from pdf_slack_bot.components.answering import answer_questions_from_pdf
+from pdf_slack_bot.components.listener import SlackEventListener
 from pdf_slack_bot.components.llms import load_llm
 
 __all__ = [
     'load_llm',
+    'answer_questions_from_pdf',
     'ActionSelector',
     'DocumentGetter',
     'DocumentRAG',
-    'SlackMessageSender'
+    'ModelRouter',
+    'IndexWarmer',
+    'SlackMessageSender',
+    'SlackEventListener'
 ]
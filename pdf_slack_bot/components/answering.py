@@ -0,0 +1,43 @@
+import os
+import asyncio
+from typing import List
+
+from pdf_slack_bot.utils import configs
+from pdf_slack_bot.components.document import DocumentGetter
+from pdf_slack_bot.components.rag import DocumentRAG, get_default_document_rag
+from pdf_slack_bot.components.warmup import IndexWarmer
+
+
+async def answer_questions_from_pdf(
+        pdf_filename: str,
+        questions: List[str],
+        index_warmer: IndexWarmer = None,
+        document_rag: DocumentRAG = None,
+) -> List[dict]:
+    """
+    Answer a list of questions about a PDF in the pdf directory.
+
+    Args:
+        pdf_filename (str): The name of the PDF file to process.
+        questions (List[str]): A list of questions to answer.
+        index_warmer (IndexWarmer, optional): Provides warm indexes for frequently used PDFs.
+        document_rag (DocumentRAG, optional): The DocumentRAG to answer with. Defaults to the shared one,
+            which uses model routing.
+
+    Returns:
+        List[dict]: A list of dictionaries containing questions and their answers.
+    """
+    document_rag = document_rag or get_default_document_rag()
+
+    if index_warmer:
+        index = await index_warmer.get_index(pdf_filename)
+        answers = await document_rag.get_answers_from_index(questions, index)
+    else:
+        document_getter = DocumentGetter()
+        pdf_filepath = os.path.join(configs.pdf_dir, pdf_filename)
+        documents = await asyncio.to_thread(document_getter.get_documents_from_pdf, filepath=pdf_filepath)
+        answers = await document_rag.get_answers_from_documents(questions, documents)
+    if document_rag.router:
+        configs.logger.info(f"Model routing stats: {document_rag.router.get_stats()}")
+
+    return [{"question": q, "answer": a} for q, a in zip(questions, answers)]
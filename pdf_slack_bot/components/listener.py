@@ -0,0 +1,301 @@
+import re
+import asyncio
+from collections import OrderedDict
+from functools import partial
+from typing import AsyncIterable, Awaitable, Callable, Dict, List, Optional, Set, Tuple
+
+from pdf_slack_bot.utils import configs
+from pdf_slack_bot.components.answering import answer_questions_from_pdf
+from pdf_slack_bot.components.rag import ANSWER_ERROR_PREFIX
+from pdf_slack_bot.components.slack import SlackMessageSender
+from pdf_slack_bot.components.warmup import IndexWarmer
+
+AnswerQuestionsFn = Callable[[str, List[str]], Awaitable[List[dict]]]
+
+
+class SlackEventListener:
+    """
+    An async listener that answers questions asked of the bot in Slack.
+
+    Events are plain Slack event payloads (as delivered by the Events API or a Socket Mode client), so the
+    listener can be driven by any async source, including a local queue. Only mentions of the bot and direct
+    messages are answered, and redelivered events are dropped. Questions about the same PDF that
+    arrive within `batch_window` seconds are answered in a single RAG run, and identical questions that are
+    already in flight share one answer, so LLM calls scale with distinct questions rather than messages.
+    """
+    _PDF_PATTERN = re.compile(r'(?<![\w.-])([\w.-]+\.pdf)(?![\w-])', re.IGNORECASE)
+    _MENTION_PATTERN = re.compile(r'<@[A-Z0-9]+>')
+    # Slack links are formatted as <url> or <url|label>
+    _LINK_PATTERN = re.compile(r'<([^<>|]+)(?:\|([^<>]*))?>')
+    # Punctuation and markup that may wrap a PDF name, e.g. `handbook.pdf` or (handbook.pdf):
+    _WRAPPING_CHARS = ' \t\n`\'"()[]*:,-'
+    _FAILED_REPLY = "Sorry, I couldn't answer that question. Please try again later."
+    _MAX_SEEN_EVENTS = 10000
+
+    def __init__(
+            self,
+            answer_questions: AnswerQuestionsFn = None,
+            slack_sender: SlackMessageSender = None,
+            default_pdf: str = None,
+            batch_window: float = 0.5,
+            max_batch_size: int = 20,
+            index_warmer: IndexWarmer = None,
+    ):
+        """
+        Initialize the SlackEventListener.
+
+        Args:
+            answer_questions (AnswerQuestionsFn, optional): Coroutine taking a PDF filename and a list of questions
+                and returning a list of question/answer dictionaries. Defaults to answer_questions_from_pdf.
+            slack_sender (SlackMessageSender, optional): The sender used to post replies.
+            default_pdf (str, optional): The PDF to use when a message does not mention one.
+            batch_window (float): Seconds to wait for more questions about a PDF before running a batch.
+            max_batch_size (int): Maximum number of distinct questions answered in a single batch.
+            index_warmer (IndexWarmer, optional): Provides warm indexes to the default answer_questions.
+        """
+        if batch_window < 0:
+            raise ValueError("Batch window must not be negative.")
+        if max_batch_size < 1:
+            raise ValueError("Max batch size must be at least 1.")
+
+        self._logger = configs.logger
+        self._answer_questions = answer_questions or partial(answer_questions_from_pdf, index_warmer=index_warmer)
+        self._slack_sender = slack_sender or SlackMessageSender()
+        self._default_pdf = default_pdf
+        self._batch_window = batch_window
+        self._max_batch_size = max_batch_size
+
+        self._inflight: Dict[Tuple[str, str], asyncio.Future] = {}
+        self._pending: Dict[str, List[Tuple[Tuple[str, str], str, asyncio.Future]]] = {}
+        self._flush_timers: Dict[str, asyncio.Task] = {}
+        self._tasks: Set[asyncio.Task] = set()
+        self._seen_events: OrderedDict = OrderedDict()
+        self._stats = {'messages': 0, 'questions': 0, 'batches': 0}
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """Counts of received messages, distinct questions answered and RAG batches run."""
+        return dict(self._stats)
+
+    @staticmethod
+    def _normalize(question: str) -> str:
+        return ' '.join(question.lower().split()).rstrip('?')
+
+    @staticmethod
+    def _unwrap_link(link: re.Match) -> str:
+        """Replace a Slack link with its label, or with the file name for an unlabelled link to a PDF."""
+        url, label = link.group(1), link.group(2)
+        if label:
+            return label
+        return url.rsplit('/', 1)[-1] if url.lower().endswith('.pdf') else url
+
+    def _parse_text(self, text: str) -> Tuple[Optional[str], str]:
+        """
+        Split a message into the PDF it refers to and the question being asked.
+
+        Args:
+            text (str): The raw message text.
+
+        Returns:
+            Tuple[Optional[str], str]: The PDF filename (or the default PDF) and the question.
+        """
+        text = self._MENTION_PATTERN.sub('', text)
+        text = self._LINK_PATTERN.sub(self._unwrap_link, text)
+        match = self._PDF_PATTERN.search(text)
+        if not match:
+            return self._default_pdf, text.strip(self._WRAPPING_CHARS)
+
+        # A PDF name leading or trailing the question is dropped from it; one inside a sentence is kept
+        before, after = text[:match.start()], text[match.end():]
+        if not before.strip(self._WRAPPING_CHARS):
+            question = after
+        elif not after.strip(self._WRAPPING_CHARS) and before.rstrip(self._WRAPPING_CHARS).endswith(('?', '.', '!')):
+            question = before
+        else:
+            question = text
+        return match.group(1), question.strip(self._WRAPPING_CHARS)
+
+    @staticmethod
+    def _is_question(event: dict) -> bool:
+        """Whether the event asks the bot something: a mention in a channel or a direct message."""
+        if event.get('bot_id') or event.get('subtype'):
+            return False
+        if event.get('type') == 'app_mention':
+            return True
+        # Mentions in channels also arrive as 'message' events, which are answered through 'app_mention'
+        return event.get('type') == 'message' and event.get('channel_type') == 'im'
+
+    def _is_duplicate(self, event: dict) -> bool:
+        """
+        Record the event and report whether it was already seen, e.g. because Slack retried its delivery.
+
+        Args:
+            event (dict): The Slack event payload.
+
+        Returns:
+            bool: True if the event was already handled.
+        """
+        message_id = event.get('client_msg_id') or event.get('ts') or event.get('event_id')
+        if message_id is None:
+            return False
+        key = (event.get('channel'), message_id)
+        if key in self._seen_events:
+            return True
+        self._seen_events[key] = None
+        if len(self._seen_events) > self._MAX_SEEN_EVENTS:
+            self._seen_events.popitem(last=False)
+        return False
+
+    def _start_task(self, coro) -> asyncio.Task:
+        task = asyncio.create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    async def ask(self, pdf_filename: str, question: str) -> str:
+        """
+        Answer a question about a PDF, joining an in-flight or pending batch when possible.
+
+        Args:
+            pdf_filename (str): The name of the PDF file to use.
+            question (str): The question to answer.
+
+        Returns:
+            str: The answer to the question.
+        """
+        key = (pdf_filename, self._normalize(question))
+        future = self._inflight.get(key)
+        if future is None:
+            future = asyncio.get_running_loop().create_future()
+            self._inflight[key] = future
+            self._enqueue(pdf_filename, key, question, future)
+        # Shield so that one cancelled waiter does not cancel the answer for everyone else
+        return await asyncio.shield(future)
+
+    def _enqueue(self, pdf_filename: str, key: Tuple[str, str], question: str, future: asyncio.Future):
+        batch = self._pending.setdefault(pdf_filename, [])
+        batch.append((key, question, future))
+        if len(batch) >= self._max_batch_size:
+            timer = self._flush_timers.pop(pdf_filename, None)
+            if timer:
+                timer.cancel()
+            self._start_task(self._run_batch(pdf_filename, self._pending.pop(pdf_filename)))
+        elif len(batch) == 1:
+            self._flush_timers[pdf_filename] = self._start_task(self._flush_later(pdf_filename))
+
+    async def _flush_later(self, pdf_filename: str):
+        await asyncio.sleep(self._batch_window)
+        self._flush_timers.pop(pdf_filename, None)
+        batch = self._pending.pop(pdf_filename, None)
+        if batch:
+            await self._run_batch(pdf_filename, batch)
+
+    async def _run_batch(self, pdf_filename: str, batch: List[Tuple[Tuple[str, str], str, asyncio.Future]]):
+        """
+        Answer a batch of distinct questions about a PDF and resolve their waiting futures.
+
+        Args:
+            pdf_filename (str): The name of the PDF file to use.
+            batch (List[Tuple[Tuple[str, str], str, asyncio.Future]]): The pending keys, questions and futures.
+        """
+        self._stats['batches'] += 1
+        self._stats['questions'] += len(batch)
+        questions = [question for _, question, _ in batch]
+        self._logger.info(f"Answering {len(questions)} question(s) about {pdf_filename}")
+        try:
+            results = await self._answer_questions(pdf_filename, questions)
+            for (_, _, future), result in zip(batch, results):
+                if not future.done():
+                    future.set_result(result["answer"])
+        except Exception as e:
+            for _, _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+        finally:
+            for key, _, future in batch:
+                if not future.done():
+                    future.set_exception(RuntimeError("No answer was returned for the question."))
+                if self._inflight.get(key) is future:
+                    del self._inflight[key]
+
+    async def handle_event(self, event: dict) -> Optional[str]:
+        """
+        Answer the question in a Slack message event and reply in its thread.
+
+        Args:
+            event (dict): The Slack event payload.
+
+        Returns:
+            Optional[str]: The reply that was posted, or None if the event was ignored.
+        """
+        if not self._is_question(event) or self._is_duplicate(event):
+            return None
+
+        pdf_filename, question = self._parse_text(event.get('text', ''))
+        if not question:
+            return None
+        self._stats['messages'] += 1
+
+        if not pdf_filename:
+            reply = "Please mention the PDF to use, e.g. `handbook.pdf What is the vacation policy?`"
+        else:
+            # Error details may contain server paths or API messages, so they are logged rather than posted
+            try:
+                reply = await self.ask(pdf_filename, question)
+                if reply.startswith(ANSWER_ERROR_PREFIX):
+                    self._logger.error(f"Failed to answer question from channel {event.get('channel')}: {reply}")
+                    reply = self._FAILED_REPLY
+            except FileNotFoundError as e:
+                self._logger.error(f"PDF requested from channel {event.get('channel')} not found: {str(e)}")
+                reply = f"I couldn't find `{pdf_filename}`. Please check the file name."
+            except Exception as e:
+                self._logger.error(f"Failed to answer question from channel {event.get('channel')}: {str(e)}")
+                reply = self._FAILED_REPLY
+
+        await asyncio.to_thread(
+            self._slack_sender.send_message,
+            message=reply,
+            channel_id=event.get('channel'),
+            thread_ts=event.get('thread_ts') or event.get('ts'),
+        )
+        return reply
+
+    async def _handle_event_safely(self, event: dict):
+        try:
+            await self.handle_event(event)
+        except Exception as e:
+            self._logger.error(f"Failed to handle Slack event: {str(e)}")
+
+    async def listen(self, events: AsyncIterable[dict]):
+        """
+        Handle events from an async source concurrently until the source is exhausted.
+
+        Args:
+            events (AsyncIterable[dict]): The Slack event payloads to handle.
+        """
+        async for event in events:
+            self._start_task(self._handle_event_safely(event))
+
+        pending = [task for task in self._tasks if not task.done()]
+        while pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+            pending = [task for task in self._tasks if not task.done()]
+
+
+if __name__ == "__main__":
+    class _PrintingSender:
+        def send_message(self, message: str, channel_id: str = None, thread_ts: str = None) -> bool:
+            print(f"[{channel_id} / {thread_ts}] {message}")
+            return True
+
+    async def _fake_events():
+        for i, (channel, text) in enumerate([
+            ("C01", "<@U0BOT> handbook.pdf What is the vacation policy?"),
+            ("C02", "handbook.pdf what is the vacation policy"),
+            ("C03", "handbook.pdf Who is the CEO of the company?"),
+        ]):
+            yield {"type": "app_mention", "channel": channel, "ts": f"1700000000.00000{i}", "text": text}
+
+    listener = SlackEventListener(slack_sender=_PrintingSender())
+    asyncio.run(listener.listen(_fake_events()))
+    print(listener.stats)
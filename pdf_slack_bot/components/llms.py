@@ -1,4 +1,4 @@
-from typing import Dict
+from typing import Dict, Tuple
 from llama_index.core.llms import LLM
 from llama_index.llms.openai import OpenAI
 
@@ -7,6 +7,12 @@ _llm_token_limits: Dict[str, int] = {
     'gpt-4o-mini': 4096,
 }
 
+# USD per 1M (prompt, completion) tokens
+_llm_token_costs: Dict[str, Tuple[float, float]] = {
+    'gpt-4o': (2.50, 10.00),
+    'gpt-4o-mini': (0.15, 0.60),
+}
+
 
 def load_llm(model: str = 'gpt-4o-mini', temperature: float = 0.2, **kwargs) -> LLM:
     """
@@ -47,3 +53,19 @@ def load_llm(model: str = 'gpt-4o-mini', temperature: float = 0.2, **kwargs) ->
 
     except Exception as e:
         raise Exception(f"An unexpected error occurred: {str(e)}") from e
+
+
+def get_llm_cost(model: str, prompt_tokens: int, completion_tokens: int) -> float:
+    """
+    Estimate the cost of LLM usage in USD.
+
+    Args:
+        model (str): The name of the model.
+        prompt_tokens (int): The number of prompt tokens used.
+        completion_tokens (int): The number of completion tokens used.
+
+    Returns:
+        float: The estimated cost in USD, or 0.0 if the model has no configured pricing.
+    """
+    prompt_cost, completion_cost = _llm_token_costs.get(model, (0.0, 0.0))
+    return (prompt_tokens * prompt_cost + completion_tokens * completion_cost) / 1_000_000
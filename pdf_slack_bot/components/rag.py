@@ -1,5 +1,5 @@
 import asyncio
-from typing import List
+from typing import List, Optional
 from llama_index.core import VectorStoreIndex, Document
 from llama_index.core.llms import LLM
 from llama_index.core.node_parser import SimpleFileNodeParser
@@ -7,6 +7,7 @@ from llama_index.core.query_engine import BaseQueryEngine
 
 from pdf_slack_bot.utils import configs
 from pdf_slack_bot.components.llms import load_llm
+from pdf_slack_bot.components.router import ModelRouter
 from pdf_slack_bot.prompts import (
     create_chat_prompt,
     QA_USER_PROMPT,
@@ -14,43 +15,63 @@ from pdf_slack_bot.prompts import (
     QA_SYSTEM_PROMPT
 )
 
+ANSWER_ERROR_PREFIX = "Error answering question: "
+
 
 class DocumentRAG:
     """
     A class for performing document retrieval and question answering.
     """
 
-    def __init__(self, llm_model: LLM = None):
+    def __init__(self, llm_model: LLM = None, router: ModelRouter = None):
         """
         Initialize the DocumentRAG with the LLM instance to use and SimpleFileNodeParser.
 
         Args:
             llm_model (LLM, optional): The instance of the LLM model to use. Defaults to DEFAULT_LLM value in configs.
+            router (ModelRouter, optional): Routes each question between a cheap and a larger LLM. When given,
+                the router's cheap LLM is used instead of llm_model.
         """
 
-        self.llm = llm_model or load_llm(model=configs.DEFAULT_LLM)
+        self.router = router
+        self.llm = router.llm if router else llm_model or load_llm(model=configs.DEFAULT_LLM)
         self._node_parser = SimpleFileNodeParser()
 
-    async def _create_query_engine(self, documents: List[Document]) -> BaseQueryEngine:
+    async def create_index(self, documents: List[Document]) -> VectorStoreIndex:
         """
-        Create and return a query engine based on the given documents and LLM.
+        Create and return a vector store index based on the given documents.
 
         Args:
             documents (List[Document]): List of documents to index.
 
-
         Returns:
-            BaseQueryEngine: The created query engine.
+            VectorStoreIndex: The created index.
         """
         try:
             nodes = self._node_parser.get_nodes_from_documents(documents)
-            index = VectorStoreIndex(
+            return VectorStoreIndex(
                 nodes,
                 use_async=True,
                 show_progress=True
             )
+        except Exception as e:
+            raise RuntimeError(f"Failed to create index: {str(e)}")
+
+    @staticmethod
+    def _create_query_engine(index: VectorStoreIndex, llm: LLM) -> BaseQueryEngine:
+        """
+        Create and return a query engine based on the given index and LLM.
+
+        Args:
+            index (VectorStoreIndex): The index to query.
+            llm (LLM): The LLM to synthesize answers with.
+
+        Returns:
+            BaseQueryEngine: The created query engine.
+        """
+        try:
             return index.as_query_engine(
-                llm=self.llm,
+                llm=llm,
                 use_async=True,
                 text_qa_template=create_chat_prompt(QA_SYSTEM_PROMPT, QA_USER_PROMPT),
                 refine_template=create_chat_prompt(QA_SYSTEM_PROMPT, QA_REFINE_USER_PROMPT),
@@ -58,22 +79,60 @@ class DocumentRAG:
         except Exception as e:
             raise RuntimeError(f"Failed to create query engine: {str(e)}")
 
-    async def _get_answer(self, query_engine: BaseQueryEngine, question: str) -> str:
+    async def _get_answer(
+            self,
+            query_engine: BaseQueryEngine,
+            question: str,
+            escalation_query_engine: BaseQueryEngine = None,
+    ) -> str:
         """
         Get an answer for a single question using the query engine.
 
         Args:
             query_engine (BaseQueryEngine): The query engine to use.
             question (str): The question to answer.
+            escalation_query_engine (BaseQueryEngine, optional): The query engine the router escalates to.
 
         Returns:
             str: The answer to the question.
         """
         try:
+            if self.router and escalation_query_engine:
+                return await self.router.aquery(query_engine, escalation_query_engine, question)
             response = await query_engine.aquery(question)
             return response.response
         except Exception as e:
-            return f"Error answering question: {str(e)}"
+            return f"{ANSWER_ERROR_PREFIX}{str(e)}"
+
+    async def get_answers_from_index(self, questions: List[str], index: VectorStoreIndex) -> List[str]:
+        """
+        Get answers for multiple questions from an already built index.
+
+        Args:
+            questions (List[str]): List of questions to answer.
+            index (VectorStoreIndex): The index to use for answering.
+
+        Returns:
+            List[str]: List of answers corresponding to the questions.
+
+        Raises:
+            ValueError: If questions are empty.
+        """
+        if not questions:
+            raise ValueError("No questions provided")
+
+        try:
+            query_engine = self._create_query_engine(index, self.llm)
+            escalation_query_engine = None
+            if self.router:
+                escalation_query_engine = self._create_query_engine(index, self.router.escalation_llm)
+                self.router.bind_token_counters()
+            answers = await asyncio.gather(*[
+                self._get_answer(query_engine, question, escalation_query_engine) for question in questions
+            ])
+            return answers
+        except Exception as e:
+            raise RuntimeError(f"Failed to get answers: {str(e)}")
 
     async def get_answers_from_documents(
             self,
@@ -99,8 +158,23 @@ class DocumentRAG:
             raise ValueError("No documents provided")
 
         try:
-            query_engine = await self._create_query_engine(documents)
-            answers = await asyncio.gather(*[self._get_answer(query_engine, question) for question in questions])
-            return answers
+            index = await self.create_index(documents)
         except Exception as e:
             raise RuntimeError(f"Failed to get answers: {str(e)}")
+        return await self.get_answers_from_index(questions, index)
+
+
+_default_document_rag: Optional[DocumentRAG] = None
+
+
+def get_default_document_rag() -> DocumentRAG:
+    """
+    Get the process-wide DocumentRAG with model routing, creating it on first use.
+
+    Returns:
+        DocumentRAG: The shared DocumentRAG instance.
+    """
+    global _default_document_rag
+    if _default_document_rag is None:
+        _default_document_rag = DocumentRAG(router=ModelRouter())
+    return _default_document_rag
@@ -0,0 +1,135 @@
+import time
+from typing import Dict, Tuple
+from llama_index.core.llms import LLM
+from llama_index.core.callbacks import CallbackManager, TokenCountingHandler
+from llama_index.core.query_engine import BaseQueryEngine
+from llama_index.core.schema import QueryBundle
+
+from pdf_slack_bot.utils import configs
+from pdf_slack_bot.components.llms import load_llm, get_llm_cost
+
+
+class ModelRouter:
+    """
+    A class for routing each question between a cheap and a larger LLM.
+
+    Questions go to the cheap model first and are escalated to the larger model only when retrieval
+    confidence is low or the cheap model's answer looks like a non-answer.
+    """
+    PRIMARY_ROUTE = 'primary'
+    NO_CONTEXT_ANSWER = 'Data Not Available'
+    ESCALATION_ROUTE = 'escalation'
+
+    def __init__(
+            self,
+            llm_model: LLM = None,
+            escalation_llm_model: LLM = None,
+            min_similarity: float = 0.75,
+            escalation_markers: Tuple[str, ...] = ("Data Not Available", "Empty Response"),
+    ):
+        """
+        Initialize the ModelRouter with the LLM instances to route between.
+
+        Args:
+            llm_model (LLM, optional): The cheap LLM tried first. Defaults to DEFAULT_LLM value in configs.
+            escalation_llm_model (LLM, optional): The larger LLM to escalate to. Defaults to ESCALATION_LLM value
+                in configs.
+            min_similarity (float): Top retrieval similarity below which a question goes straight to the larger LLM.
+            escalation_markers (Tuple[str, ...]): Phrases in the cheap LLM's answer that trigger escalation.
+        """
+        self.llm = llm_model or load_llm(model=configs.DEFAULT_LLM)
+        self.escalation_llm = escalation_llm_model or load_llm(model=configs.ESCALATION_LLM)
+        if self.llm is self.escalation_llm:
+            raise ValueError("The primary and escalation LLMs must be separate instances.")
+        self._min_similarity = min_similarity
+        self._escalation_markers = tuple(marker.lower() for marker in escalation_markers)
+
+        self._logger = configs.logger
+        self._token_counters: Dict[str, TokenCountingHandler] = {}
+        self._callback_managers: Dict[str, CallbackManager] = {}
+        self._stats: Dict[str, dict] = {}
+        for route, llm in self._routes():
+            self._token_counters[route] = TokenCountingHandler()
+            self._callback_managers[route] = CallbackManager([self._token_counters[route]])
+            self._stats[route] = {'model': getattr(llm, 'model', None), 'calls': 0, 'latency': 0.0}
+
+    def _routes(self) -> Tuple[Tuple[str, LLM], ...]:
+        return (self.PRIMARY_ROUTE, self.llm), (self.ESCALATION_ROUTE, self.escalation_llm)
+
+    def bind_token_counters(self):
+        """
+        Point each route's LLM at a callback manager holding only that route's token counter.
+
+        Creating a query engine replaces the LLM's callback manager with the global one, so this must be
+        called after the query engines for a run have been created.
+        """
+        for route, llm in self._routes():
+            llm.callback_manager = self._callback_managers[route]
+
+    def _should_escalate(self, answer: str) -> bool:
+        answer = (answer or '').strip().lower()
+        return not answer or any(marker in answer for marker in self._escalation_markers)
+
+    async def _synthesize(self, route: str, query_engine: BaseQueryEngine, query_bundle: QueryBundle, nodes) -> str:
+        start = time.perf_counter()
+        try:
+            response = await query_engine.asynthesize(query_bundle, nodes)
+            return response.response
+        finally:
+            self._stats[route]['calls'] += 1
+            self._stats[route]['latency'] += time.perf_counter() - start
+
+    async def aquery(self, query_engine: BaseQueryEngine, escalation_query_engine: BaseQueryEngine, question: str) -> str:
+        """
+        Answer a question, escalating to the larger LLM only when needed.
+
+        Retrieval runs once and the retrieved nodes are reused if the question is escalated. If nothing is
+        retrieved, no LLM is called and the answer is 'Data Not Available'.
+
+        Args:
+            query_engine (BaseQueryEngine): The query engine using the cheap LLM.
+            escalation_query_engine (BaseQueryEngine): The query engine using the larger LLM, over the same index.
+            question (str): The question to answer.
+
+        Returns:
+            str: The answer to the question.
+        """
+        query_bundle = QueryBundle(question)
+        nodes = await query_engine.aretrieve(query_bundle)
+        if not nodes:
+            self._logger.info(f"No context retrieved for question '{question}'")
+            return self.NO_CONTEXT_ANSWER
+        top_similarity = max((node.score for node in nodes if node.score is not None), default=None)
+
+        if top_similarity is not None and top_similarity >= self._min_similarity:
+            answer = await self._synthesize(self.PRIMARY_ROUTE, query_engine, query_bundle, nodes)
+            if not self._should_escalate(answer):
+                return answer
+            reason = "non-answer from primary model"
+        else:
+            reason = f"low retrieval similarity ({top_similarity})"
+
+        self._logger.info(f"Escalating question '{question}': {reason}")
+        return await self._synthesize(self.ESCALATION_ROUTE, escalation_query_engine, query_bundle, nodes)
+
+    def get_stats(self) -> Dict[str, dict]:
+        """
+        Get per-route call counts, latency, token usage and estimated cost.
+
+        Returns:
+            Dict[str, dict]: Stats keyed by route name.
+        """
+        stats = {}
+        for route, route_stats in self._stats.items():
+            counter = self._token_counters[route]
+            calls = route_stats['calls']
+            stats[route] = {
+                **route_stats,
+                'avg_latency': route_stats['latency'] / calls if calls else 0.0,
+                'prompt_tokens': counter.prompt_llm_token_count,
+                'completion_tokens': counter.completion_llm_token_count,
+                'cost': get_llm_cost(
+                    route_stats['model'], counter.prompt_llm_token_count, counter.completion_llm_token_count
+                ),
+            }
+        return stats
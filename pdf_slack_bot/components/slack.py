@@ -45,12 +45,14 @@ class SlackMessageSender:
         response.raise_for_status()
         return response
 
-    def send_message(self, message: str) -> bool:
+    def send_message(self, message: str, channel_id: str = None, thread_ts: str = None) -> bool:
         """
         Send a message to Slack.
 
         Args:
             message (str): The message to be sent.
+            channel_id (str, optional): The channel to post to. Defaults to SLACK_CHANNEL_ID from the environment.
+            thread_ts (str, optional): The timestamp of the parent message to reply in a thread.
 
         Returns:
             bool: True if the message was sent successfully, False otherwise.
@@ -58,13 +60,16 @@ class SlackMessageSender:
         Raises:
             ValueError: If the Slack bot token or channel ID is not set.
         """
-        if not self._bot_token or not self._channel_id:
+        channel_id = channel_id or self._channel_id
+        if not self._bot_token or not channel_id:
             raise ValueError("Slack bot token or channel ID is not set.")
 
         slack_data = {
-            'channel': self._channel_id,
+            'channel': channel_id,
             'text': message
         }
+        if thread_ts:
+            slack_data['thread_ts'] = thread_ts
 
         try:
             response = self._send_request(slack_data)
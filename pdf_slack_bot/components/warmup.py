@@ -0,0 +1,253 @@
+import os
+import time
+import asyncio
+from collections import Counter
+from typing import Dict, List, Optional, Tuple
+from llama_index.core import VectorStoreIndex
+
+from pdf_slack_bot.utils import configs
+from pdf_slack_bot.components.document import DocumentGetter
+from pdf_slack_bot.components.rag import DocumentRAG, get_default_document_rag
+
+# Approximate bytes per embedding value held in a Python list (8 byte pointer + 24 byte float object)
+_BYTES_PER_EMBEDDING_VALUE = 32
+
+
+class IndexWarmer:
+    """
+    A class for keeping the indexes of frequently used PDFs built and in memory.
+
+    Accesses are counted per file, and a background task watches the PDF directory and pre-builds the indexes
+    of the top-N most used PDFs, rebuilding them when the file changes, within a memory budget.
+    """
+
+    def __init__(
+            self,
+            document_rag: DocumentRAG = None,
+            document_getter: DocumentGetter = None,
+            pdf_dir: str = None,
+            top_n: int = 3,
+            memory_budget_mb: float = 512,
+            poll_interval: float = 10.0,
+    ):
+        """
+        Initialize the IndexWarmer.
+
+        Args:
+            document_rag (DocumentRAG, optional): The DocumentRAG used to build indexes. Defaults to the shared one.
+            document_getter (DocumentGetter, optional): The DocumentGetter used to extract documents from PDFs.
+            pdf_dir (str, optional): The directory to watch. Defaults to pdf_dir value in configs.
+            top_n (int): Number of most used PDFs to keep warm.
+            memory_budget_mb (float): Approximate memory budget for all cached indexes, in megabytes.
+            poll_interval (float): Seconds between scans of the PDF directory.
+        """
+        if top_n < 1:
+            raise ValueError("Top N must be at least 1.")
+        if memory_budget_mb <= 0:
+            raise ValueError("Memory budget must be positive.")
+
+        self._logger = configs.logger
+        self._document_rag = document_rag or get_default_document_rag()
+        self._document_getter = document_getter or DocumentGetter()
+        self._pdf_dir = pdf_dir or configs.pdf_dir
+        self._top_n = top_n
+        self._memory_budget = int(memory_budget_mb * 1024 * 1024)
+        self._poll_interval = poll_interval
+
+        self._access_counts: Counter = Counter()
+        self._last_access: Dict[str, float] = {}
+        # pdf_filename -> (file mtime, index, estimated size in bytes)
+        self._cache: Dict[str, Tuple[float, VectorStoreIndex, int]] = {}
+        self._building: Dict[Tuple[str, float], asyncio.Task] = {}
+        # (pdf_filename, mtime) -> rank at the time its index was evicted for not fitting the memory budget
+        self._unfit: Dict[Tuple[str, float], Tuple[int, float, float]] = {}
+        self._watch_task: Optional[asyncio.Task] = None
+        self._stats = {'hits': 0, 'misses': 0, 'warmed': 0, 'evicted': 0}
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """Counts of cache hits, cold builds, background warm-ups and evictions."""
+        return dict(self._stats)
+
+    @property
+    def memory_usage(self) -> int:
+        """Estimated size of all cached indexes, in bytes."""
+        return sum(size for _, _, size in self._cache.values())
+
+    def record_access(self, pdf_filename: str):
+        """
+        Record a use of a PDF, making it more likely to be kept warm.
+
+        Args:
+            pdf_filename (str): The name of the PDF file.
+        """
+        self._access_counts[pdf_filename] += 1
+        self._last_access[pdf_filename] = time.time()
+
+    def _rank(self, pdf_filename: str, mtime: float) -> Tuple[int, float, float]:
+        """Rank a PDF by access count, then most recent access, then newest file. Higher is hotter."""
+        return self._access_counts[pdf_filename], self._last_access.get(pdf_filename, 0.0), mtime
+
+    def _scan(self) -> Dict[str, float]:
+        """Return the modification time of each PDF in the watched directory."""
+        return {
+            entry.name: entry.stat().st_mtime
+            for entry in os.scandir(self._pdf_dir)
+            if entry.is_file() and entry.name.lower().endswith('.pdf')
+        }
+
+    def _hot_set(self, mtimes: Dict[str, float]) -> List[str]:
+        return sorted(mtimes, key=lambda name: self._rank(name, mtimes[name]), reverse=True)[:self._top_n]
+
+    @staticmethod
+    def _estimate_index_size(index: VectorStoreIndex) -> int:
+        """
+        Estimate the memory held by an in-memory index from its node text and embeddings.
+
+        Args:
+            index (VectorStoreIndex): The index to measure.
+
+        Returns:
+            int: The estimated size in bytes.
+        """
+        size = sum(len(node.get_content().encode()) for node in index.docstore.docs.values())
+        embedding_dict = getattr(getattr(index.vector_store, 'data', None), 'embedding_dict', {})
+        size += sum(len(embedding) for embedding in embedding_dict.values()) * _BYTES_PER_EMBEDDING_VALUE
+        return size
+
+    async def _build(self, pdf_filename: str, mtime: float) -> VectorStoreIndex:
+        """
+        Build the index for a PDF, sharing the work between concurrent callers for the same file version.
+
+        Args:
+            pdf_filename (str): The name of the PDF file.
+            mtime (float): The modification time of the file being indexed.
+
+        Returns:
+            VectorStoreIndex: The built index.
+        """
+        key = (pdf_filename, mtime)
+        task = self._building.get(key)
+        if task is None:
+            task = asyncio.create_task(self._build_and_cache(pdf_filename, mtime))
+            self._building[key] = task
+            task.add_done_callback(lambda _: self._building.pop(key, None))
+        return await asyncio.shield(task)
+
+    async def _build_and_cache(self, pdf_filename: str, mtime: float) -> VectorStoreIndex:
+        filepath = os.path.join(self._pdf_dir, pdf_filename)
+        documents = await asyncio.to_thread(self._document_getter.get_documents_from_pdf, filepath=filepath)
+        index = await self._document_rag.create_index(documents)
+        size = self._estimate_index_size(index)
+        cached = self._cache.get(pdf_filename)
+        if cached and cached[0] > mtime:
+            # A newer version of the file was indexed while this build was running
+            return index
+        self._cache[pdf_filename] = (mtime, index, size)
+        self._unfit.pop((pdf_filename, mtime), None)
+        self._evict()
+        self._logger.info(f"Built index for {pdf_filename} (~{size / (1024 * 1024):.1f} MB)")
+        return index
+
+    def _evict(self, mtimes: Dict[str, float] = None):
+        """
+        Drop the indexes of PDFs outside the top-N most used, then the least used until the cache fits
+        within the memory budget.
+
+        Args:
+            mtimes (Dict[str, float], optional): A fresh scan of the PDF directory, to avoid scanning again.
+        """
+        hot_set = set(self._hot_set(mtimes if mtimes is not None else self._scan()))
+        for pdf_filename in [name for name in self._cache if name not in hot_set]:
+            del self._cache[pdf_filename]
+            self._stats['evicted'] += 1
+            self._logger.info(f"Evicted index for {pdf_filename}: not among the {self._top_n} most used PDFs")
+
+        while self._cache and self.memory_usage > self._memory_budget:
+            pdf_filename = min(self._cache, key=lambda name: self._rank(name, self._cache[name][0]))
+            mtime = self._cache.pop(pdf_filename)[0]
+            self._unfit[(pdf_filename, mtime)] = self._rank(pdf_filename, mtime)
+            self._stats['evicted'] += 1
+            self._logger.info(f"Evicted index for {pdf_filename} to stay within the memory budget")
+
+    async def get_index(self, pdf_filename: str) -> VectorStoreIndex:
+        """
+        Get the index for a PDF, building it if it is not warm or the file has changed.
+
+        A cold-built index is only kept if the PDF is among the top-N most used.
+
+        Args:
+            pdf_filename (str): The name of the PDF file in the watched directory.
+
+        Returns:
+            VectorStoreIndex: The index for the PDF.
+
+        Raises:
+            FileNotFoundError: If the specified file does not exist.
+        """
+        filepath = os.path.join(self._pdf_dir, pdf_filename)
+        if not os.path.exists(filepath):
+            raise FileNotFoundError(f"The file {filepath} does not exist.")
+
+        self.record_access(pdf_filename)
+        mtime = os.path.getmtime(filepath)
+        cached = self._cache.get(pdf_filename)
+        if cached and cached[0] == mtime:
+            self._stats['hits'] += 1
+            return cached[1]
+
+        self._stats['misses'] += 1
+        return await self._build(pdf_filename, mtime)
+
+    async def refresh(self):
+        """
+        Scan the PDF directory once, dropping indexes of removed or no longer popular files and warming the
+        most used PDFs.
+        """
+        mtimes = self._scan()
+        for pdf_filename in [name for name in self._cache if name not in mtimes]:
+            del self._cache[pdf_filename]
+        self._unfit = {key: rank for key, rank in self._unfit.items() if mtimes.get(key[0]) == key[1]}
+        self._evict(mtimes)
+
+        for pdf_filename in self._hot_set(mtimes):
+            mtime = mtimes[pdf_filename]
+            cached = self._cache.get(pdf_filename)
+            if cached and cached[0] == mtime:
+                continue
+            if self._unfit.get((pdf_filename, mtime)) == self._rank(pdf_filename, mtime):
+                # Evicted for the memory budget and nothing has changed since, so rebuilding it (or warming
+                # less used PDFs) would be wasted
+                break
+            try:
+                await self._build(pdf_filename, mtime)
+                self._stats['warmed'] += 1
+            except Exception as e:
+                self._logger.error(f"Failed to warm index for {pdf_filename}: {str(e)}")
+                continue
+            if pdf_filename not in self._cache:
+                # The index does not fit alongside more used ones, so warming less used PDFs is pointless
+                break
+
+    async def _watch(self):
+        while True:
+            try:
+                await self.refresh()
+            except Exception as e:
+                self._logger.error(f"Failed to refresh warm indexes: {str(e)}")
+            await asyncio.sleep(self._poll_interval)
+
+    def start(self):
+        """Start watching the PDF directory and warming indexes in the background."""
+        if self._watch_task is None or self._watch_task.done():
+            self._watch_task = asyncio.create_task(self._watch())
+
+    async def stop(self):
+        """Stop the background watcher."""
+        if self._watch_task is not None:
+            self._watch_task.cancel()
+            try:
+                await self._watch_task
+            except asyncio.CancelledError:
+                pass
+            self._watch_task = None
@@ -23,7 +23,8 @@ configs = {
     'root_dir': root_dir,
     'pdf_dir': pdf_dir,
     'logger': logger,
-    'DEFAULT_LLM': 'gpt-4o-mini'
+    'DEFAULT_LLM': 'gpt-4o-mini',
+    'ESCALATION_LLM': 'gpt-4o'
 }
 
 configs = DotDict(configs)
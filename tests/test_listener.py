@@ -0,0 +1,148 @@
+import asyncio
+from typing import List
+
+import pytest
+
+from pdf_slack_bot.components.listener import SlackEventListener
+
+
+class FakeAnswerer:
+    """Stands in for answer_questions_from_pdf, recording every batch it is asked to answer."""
+
+    def __init__(self, fail: bool = False, delay: float = 0.01):
+        self.batches = []
+        self._fail = fail
+        self._delay = delay
+
+    async def __call__(self, pdf_filename: str, questions: List[str]) -> List[dict]:
+        self.batches.append((pdf_filename, list(questions)))
+        await asyncio.sleep(self._delay)
+        if self._fail:
+            raise RuntimeError("LLM unavailable at /srv/secret/path")
+        return [{"question": q, "answer": f"answer to {q}"} for q in questions]
+
+
+class FakeSender:
+    """Stands in for SlackMessageSender, recording replies instead of posting them."""
+
+    def __init__(self):
+        self.sent = []
+
+    def send_message(self, message: str, channel_id: str = None, thread_ts: str = None) -> bool:
+        self.sent.append({"message": message, "channel": channel_id, "thread_ts": thread_ts})
+        return True
+
+
+def _mention(text: str, ts: str, channel: str = "C01", **extra) -> dict:
+    return {"type": "app_mention", "channel": channel, "ts": ts, "text": f"<@U0BOT> {text}", **extra}
+
+
+def _listen(listener: SlackEventListener, events: List[dict]):
+    async def source():
+        for event in events:
+            yield event
+
+    asyncio.run(listener.listen(source()))
+
+
+def _make_listener(answerer: FakeAnswerer, sender: FakeSender, **kwargs) -> SlackEventListener:
+    return SlackEventListener(answer_questions=answerer, slack_sender=sender, batch_window=0.05, **kwargs)
+
+
+def test_duplicate_and_normalized_questions_share_one_batch():
+    answerer, sender = FakeAnswerer(), FakeSender()
+    listener = _make_listener(answerer, sender)
+
+    _listen(listener, [
+        _mention("handbook.pdf What is the vacation policy?", ts="1", channel="C01"),
+        _mention("handbook.pdf what is   the vacation policy", ts="2", channel="C02"),
+        _mention("handbook.pdf Who is the CEO?", ts="3", channel="C03"),
+    ])
+
+    assert answerer.batches == [("handbook.pdf", ["What is the vacation policy?", "Who is the CEO?"])]
+    assert len(sender.sent) == 3
+    assert {reply["channel"] for reply in sender.sent} == {"C01", "C02", "C03"}
+    assert listener.stats == {"messages": 3, "questions": 2, "batches": 1}
+
+
+def test_max_batch_size_splits_batches():
+    answerer, sender = FakeAnswerer(), FakeSender()
+    listener = _make_listener(answerer, sender, max_batch_size=2)
+
+    _listen(listener, [_mention(f"handbook.pdf Question {i}?", ts=str(i)) for i in range(5)])
+
+    assert sorted(len(questions) for _, questions in answerer.batches) == [1, 2, 2]
+    assert len(sender.sent) == 5
+
+
+def test_redelivered_and_non_mention_events_are_ignored():
+    answerer, sender = FakeAnswerer(), FakeSender()
+    listener = _make_listener(answerer, sender, default_pdf="handbook.pdf")
+    mention = _mention("Who is the CEO?", ts="1", client_msg_id="abc")
+
+    _listen(listener, [
+        mention,
+        dict(mention),  # Events API retry
+        {**mention, "type": "message"},  # the 'message' twin of the mention
+        {"type": "message", "channel": "C01", "ts": "2", "text": "lol good morning everyone"},
+        {"type": "app_mention", "channel": "C01", "ts": "3", "text": "<@U0BOT> hi", "bot_id": "B01"},
+    ])
+
+    assert answerer.batches == [("handbook.pdf", ["Who is the CEO?"])]
+    assert len(sender.sent) == 1
+    assert sender.sent[0]["thread_ts"] == "1"
+
+
+def test_direct_messages_are_answered():
+    answerer, sender = FakeAnswerer(), FakeSender()
+    listener = _make_listener(answerer, sender, default_pdf="handbook.pdf")
+
+    _listen(listener, [{"type": "message", "channel_type": "im", "channel": "D01", "ts": "1", "text": "Who?"}])
+
+    assert sender.sent == [{"message": "answer to Who?", "channel": "D01", "thread_ts": "1"}]
+
+
+def test_failed_batch_errors_every_waiter():
+    answerer, sender = FakeAnswerer(fail=True), FakeSender()
+    listener = _make_listener(answerer, sender)
+
+    async def ask_all():
+        return await asyncio.gather(
+            listener.ask("handbook.pdf", "What is the vacation policy?"),
+            listener.ask("handbook.pdf", "what is the vacation policy"),
+            listener.ask("handbook.pdf", "Who is the CEO?"),
+            return_exceptions=True,
+        )
+
+    results = asyncio.run(ask_all())
+
+    assert len(answerer.batches) == 1
+    assert all(isinstance(result, RuntimeError) for result in results)
+
+
+def test_failed_batch_replies_without_error_details():
+    answerer, sender = FakeAnswerer(fail=True), FakeSender()
+    listener = _make_listener(answerer, sender)
+
+    _listen(listener, [
+        _mention("handbook.pdf What is the vacation policy?", ts="1"),
+        _mention("handbook.pdf Who is the CEO?", ts="2"),
+    ])
+
+    assert len(sender.sent) == 2
+    assert all("/srv/secret/path" not in reply["message"] for reply in sender.sent)
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("handbook.pdf What is the vacation policy?", ("handbook.pdf", "What is the vacation policy?")),
+    ("`handbook.pdf` Why?", ("handbook.pdf", "Why?")),
+    ("(handbook.pdf) Why?", ("handbook.pdf", "Why?")),
+    ("Who is the CEO? `handbook.pdf`", ("handbook.pdf", "Who is the CEO?")),
+    ("what's in handbook.pdf?", ("handbook.pdf", "what's in handbook.pdf?")),
+    ("<https://files.slack.com/a.pdf|a.pdf> Why?", ("a.pdf", "Why?")),
+    ("<@U0BOT> What is the vacation policy?", (None, "What is the vacation policy?")),
+])
+def test_parse_text(text, expected):
+    listener = SlackEventListener(answer_questions=FakeAnswerer(), slack_sender=FakeSender())
+
+    assert listener._parse_text(text) == expected